@@ -5,6 +5,7 @@ Base classes for various parts of rabbitpy
 import logging
 import threading
 
+from pamqp import frame as pamqp_frame
 from pamqp import specification
 
 from rabbitpy import exceptions
@@ -179,7 +180,6 @@ class AMQPChannel(StatefulObject):
         self._state = self.CLOSED
         self._read_queue = None
         self._waiting = False
-        self._write_lock = threading.Lock()
         self._write_queue = None
         self._write_trigger = write_trigger
 
@@ -242,8 +242,9 @@ class AMQPChannel(StatefulObject):
                                     specification.Basic.Nack])
 
     def write_frame(self, frame):
-        """Put the frame in the write queue for the IOWriter object to write to
-        the socket when it can. This should not be directly invoked.
+        """Marshal the frame and put it in the write queue for the IOWriter
+        object to write to the socket when it can. This should not be directly
+        invoked.
 
         :param pamqp.specification.Frame frame: The frame to write
 
@@ -251,13 +252,13 @@ class AMQPChannel(StatefulObject):
         if self._can_write():
             if self._is_debugging:
                 LOGGER.debug('Writing frame: %s', frame.name)
-            with self._write_lock:
-                self._write_queue.put((self._channel_id, frame))
+            self._write_queue.append(
+                pamqp_frame.marshal(frame, self._channel_id))
             self._trigger_write()
 
     def write_frames(self, frames):
-        """Add a list of frames for the IOWriter object to write to the socket
-        when it can.
+        """Marshal a list of frames and add them for the IOWriter object to
+        write to the socket when it can.
 
         :param list frames: The list of frame to write
 
@@ -266,10 +267,11 @@ class AMQPChannel(StatefulObject):
             if self._is_debugging:
                 LOGGER.debug('Writing frames: %r',
                              [frame.name for frame in frames])
-            with self._write_lock:
-                # pylint: disable=expression-not-assigned
-                [self._write_queue.put((self._channel_id, frame))
-                 for frame in frames]
+            values = [pamqp_frame.marshal(frame, self._channel_id)
+                      for frame in frames]
+            # deque.extend adds a list in one step, so the frames of a message
+            # are not interleaved with frames written by other threads
+            self._write_queue.extend(values)
             self._trigger_write()
 
     def _build_close_frame(self):
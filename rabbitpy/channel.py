@@ -50,8 +50,8 @@ class Channel(base.AMQPChannel):
     :type exception_queue: queue.Queue
     :param read_queue: Queue to read pending frames from
     :type read_queue: queue.Queue
-    :param write_queue: Queue to write pending AMQP objs to
-    :type write_queue: queue.Queue
+    :param write_queue: Queue to write pending marshalled AMQP frames to
+    :type write_queue: collections.deque
     :param int maximum_frame_size: The max frame size for msg bodies
     :param socket write_trigger: Write to this socket to break IO waiting
     :param bool blocking_read: Use blocking Queue.get to improve performance
@@ -32,7 +32,7 @@ class Channel0(base.AMQPChannel):
     :param exception_queue: The queue where any pending exceptions live
     :type exception_queue: queue.Queue
     :param write_queue: The queue to place data to write in
-    :type write_queue: queue.Queue
+    :type write_queue: collections.deque
     :param write_trigger: The socket to write to, to trigger IO writes
     :type write_trigger: socket.socket
 
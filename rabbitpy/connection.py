@@ -2,6 +2,7 @@
 The Connection class negotiates and manages the connection state.
 
 """
+import collections
 import logging
 # pylint: disable=import-error
 try:
@@ -113,7 +114,7 @@ class Connection(base.StatefulObject):
         self._exceptions = queue.Queue()
 
         # One queue for writing frames, regardless of the channel sending them
-        self._write_queue = queue.Queue()
+        self._write_queue = collections.deque()
 
         # Lock used when managing the channel stack
         self._channel_lock = threading.Lock()
@@ -239,15 +240,17 @@ class Connection(base.StatefulObject):
         """
         return self._channel0.properties
 
-    def _add_channel_to_io(self, channel_id, channel_queue):
+    def _add_channel_to_io(self, channel_id, channel_queue,
+                           on_frame_callback=None):
         """Add a channel and queue to the IO object.
 
         :param Queue.Queue channel_queue: Channel inbound msg queue
         :param rabbitpy.base.AMQPChannel: The channel to add
+        :param callable on_frame_callback: Invoked by IO for received frames
 
         """
         LOGGER.debug('Adding channel %s to io', int(channel_id))
-        self._io.add_channel(channel_id, channel_queue)
+        self._io.add_channel(channel_id, channel_queue, on_frame_callback)
 
     @property
     def _api_credentials(self):
@@ -307,9 +310,9 @@ class Connection(base.StatefulObject):
         if self.closed:
             return self.close()
 
-        # Create the Channel0 queue and add it to the IO thread
+        # Create Channel0 and have the IO thread pass it frames directly
         self._channel0 = self._create_channel0()
-        self._add_channel_to_io(self._channel0, None)
+        self._add_channel_to_io(self._channel0, None, self._channel0.on_frame)
         self._channel0.start()
 
         # Wait for Channel0 to raise an exception or negotiate the connection
@@ -6,11 +6,14 @@ level.
 import collections
 import errno
 import logging
+import os
 import select
 import socket
 import ssl
+import struct
 import threading
 
+from pamqp import body
 from pamqp import frame
 from pamqp import exceptions as pamqp_exceptions
 from pamqp import specification
@@ -21,18 +24,45 @@ from rabbitpy import exceptions
 
 LOGGER = logging.getLogger(__name__)
 
-MAX_READ = specification.FRAME_MAX_SIZE
+MAX_READ = 262144
 MAX_WRITE = specification.FRAME_MAX_SIZE
 
+# Frame type, channel id and payload size preceding each AMQP frame
+FRAME_HEADER = struct.Struct('>BHI')
+
+# Maximum number of reads from the socket per poll
+MAX_READ_BATCH = 16
+
+# Maximum number of frames to move from the write queue per poll
+MAX_WRITE_BATCH = 1024
+
+# Maximum number of frames to pass to socket.sendmsg, the common IOV_MAX
+MAX_WRITE_VECTORS = 1024
+
+# Maximum number of read/write passes per poll made without waiting on the
+# poller while the socket is known to have work available
+MAX_BUSY_POLL = 8
+
 # Timeout in seconds
 POLL_TIMEOUT = 1.0
 
+# Bytes to read from the write trigger when clearing it
+TRIGGER_READ = 4096
+
+# Sockets can only be read from as file descriptors on POSIX platforms
+POSIX = os.name == 'posix'
+
 
 class _SelectPoller(object):
     def __init__(self, fd, write_trigger):
+        fd, write_trigger = fd.fileno(), write_trigger.fileno()
         self.read = [[fd, write_trigger], [], [fd], POLL_TIMEOUT]
         self.write = [[fd, write_trigger], [fd], [fd], POLL_TIMEOUT]
 
+    def close(self):
+        """Nothing to release, the poller does not hold any descriptors."""
+        pass
+
     def poll(self, write_wanted):
         """Invoke select.select, waiting for it to return with the per action
         list of file descriptors that are returned to the IO Loop.
@@ -49,15 +79,19 @@ class _SelectPoller(object):
                 rlist, wlist, xlist = select.select(*self.read)
         except select.error:
             return [], [], []
-        return ([sock.fileno() for sock in rlist],
-                [sock.fileno() for sock in wlist],
-                [sock.fileno() for sock in xlist])
+        return rlist, wlist, xlist
 
 
 class _KQueuePoller(object):
 
     MAX_EVENTS = 1000
 
+    # Register constants to prevent errors on platforms without kqueue
+    KQ_FILTER_READ = getattr(select, 'KQ_FILTER_READ', -1)
+    KQ_FILTER_WRITE = getattr(select, 'KQ_FILTER_WRITE', -2)
+    KQ_EV_ERROR = getattr(select, 'KQ_EV_ERROR', 0x4000)
+    KQ_EV_EOF = getattr(select, 'KQ_EV_EOF', 0x8000)
+
     def __init__(self, fd, write_trigger):
         self._fd = fd
         self._write_trigger = write_trigger
@@ -69,6 +103,10 @@ class _KQueuePoller(object):
                                             select.KQ_EV_ADD)], 0)
         self._write_in_last_poll = False
 
+    def close(self):
+        """Close the KQueue object, releasing its file descriptor."""
+        self._kqueue.close()
+
     def poll(self, write_wanted):
         """Update the KQueue object with the desired actions to block on,
         waiting until the KQueue.control method returns events and then returns
@@ -80,22 +118,24 @@ class _KQueuePoller(object):
         :return: (read, write, error)
 
         """
-        rlist, wlist, xlist = [], [], []
         try:
             kq_events = self._kqueue.control(self._changelist(write_wanted),
                                              self.MAX_EVENTS, POLL_TIMEOUT)
         except select.error as error:
             LOGGER.debug('kqueue.control error: %s', error)
             return [], [], []
+        if not kq_events:
+            return [], [], []
+        rlist, wlist, xlist = [], [], []
+        read_filter, write_filter = self.KQ_FILTER_READ, self.KQ_FILTER_WRITE
+        error_flags = self.KQ_EV_ERROR | self.KQ_EV_EOF
         for event in kq_events:
-            if event.filter == select.KQ_FILTER_READ:
+            if event.filter == read_filter:
                 rlist.append(event.ident)
-            elif event.filter == select.KQ_FILTER_WRITE:
+            elif event.filter == write_filter:
                 wlist.append(event.ident)
-            if event.flags & select.KQ_EV_ERROR:
+            if event.flags & error_flags:
                 xlist.append(event.ident)
-            if event.flags & select.KQ_EV_EOF == select.KQ_EV_EOF:
-                xlist.append(event.data)
         if xlist:
             self._cleanup()
         return rlist, wlist, xlist
@@ -112,14 +152,74 @@ class _KQueuePoller(object):
         return None
 
     def _cleanup(self):
-        self._kqueue.control([select.kevent(self._fd, select.KQ_FILTER_READ,
-                                            select.KQ_EV_DELETE)], 0)
-        self._kqueue.control([select.kevent(self._write_trigger,
-                                            select.KQ_FILTER_READ,
-                                            select.KQ_EV_DELETE)], 0)
+        """Remove the registered filters from the KQueue object after a socket
+        error, ignoring errors for filters the kernel already removed.
+
+        """
+        changelist = [select.kevent(self._fd, select.KQ_FILTER_READ,
+                                    select.KQ_EV_DELETE),
+                      select.kevent(self._write_trigger,
+                                    select.KQ_FILTER_READ,
+                                    select.KQ_EV_DELETE)]
         if self._write_in_last_poll:
-            return [select.kevent(self._fd, select.KQ_FILTER_WRITE,
-                                  select.KQ_EV_DELETE)]
+            changelist.append(select.kevent(self._fd, select.KQ_FILTER_WRITE,
+                                            select.KQ_EV_DELETE))
+        try:
+            self._kqueue.control(changelist, 0)
+        except select.error:
+            pass
+        self._write_in_last_poll = False
+
+
+class _EPollPoller(object):
+
+    # Register constants to prevent platform specific errors
+    EPOLLIN = 1
+    EPOLLOUT = 4
+    EPOLLERR = 8
+
+    READ = EPOLLIN | EPOLLERR
+    WRITE = EPOLLIN | EPOLLOUT | EPOLLERR
+
+    def __init__(self, fd, write_trigger):
+        self._fd = fd.fileno()
+        self._epoll = select.epoll()
+        self._epoll.register(self._fd, self.READ)
+        self._epoll.register(write_trigger.fileno(), self.READ)
+        self._write_in_last_poll = False
+
+    def close(self):
+        """Close the EPoll object, releasing its file descriptor."""
+        self._epoll.close()
+
+    def poll(self, write_wanted):
+        """Update the EPoll object if the desired actions to block on changed
+        since the last poll, waiting until it returns events and then returns
+        the list of actions containing file descriptors to act on for those
+        actions.
+
+        :param bool write_wanted: Is there data pending to be written
+        :rtype: tuple(list, list, list)
+        :return: (read, write, error)
+
+        """
+        if write_wanted != self._write_in_last_poll:
+            self._write_in_last_poll = write_wanted
+            self._epoll.modify(self._fd,
+                               self.WRITE if write_wanted else self.READ)
+        rlist, wlist, xlist = [], [], []
+        try:
+            poll_events = self._epoll.poll(POLL_TIMEOUT)
+        except select.error:
+            return [], [], []
+        for fileno, event in poll_events:
+            if event & self.EPOLLIN:
+                rlist.append(fileno)
+            if event & self.EPOLLOUT:
+                wlist.append(fileno)
+            if event & self.EPOLLERR:
+                xlist.append(fileno)
+        return rlist, wlist, xlist
 
 
 class _PollPoller(object):
@@ -139,6 +239,10 @@ class _PollPoller(object):
         self._poll.register(write_trigger, self.READ)
         self._write_in_last_poll = False
 
+    def close(self):
+        """Nothing to release, the poller does not hold any descriptors."""
+        pass
+
     def poll(self, write_wanted):
         """Update the Poll object with the desired actions to block on, waiting
         until the poll returns events and then returns the list of actions
@@ -165,33 +269,147 @@ class _PollPoller(object):
         return rlist, wlist, xlist
 
     def _update_poll(self, write_wanted):
-        if self._write_in_last_poll:
-            if not write_wanted:
-                self._write_in_last_poll = False
-                self._poll.modify(self._fd, self.READ)
-        else:
-            self._write_in_last_poll = True
-            self._poll.modify(self._fd, self.WRITE)
+        if write_wanted != self._write_in_last_poll:
+            self._write_in_last_poll = write_wanted
+            self._poll.modify(self._fd,
+                              self.WRITE if write_wanted else self.READ)
+
+
+POLLERS = {'epoll': _EPollPoller,
+           'kqueue': _KQueuePoller,
+           'poll': _PollPoller,
+           'select': _SelectPoller}
+
+
+def _get_poller_class():
+    """Return the most efficient poller class available on the platform,
+    preferring epoll, then kqueue, then poll and falling back to select. The
+    ``RABBITPY_POLLER`` environment variable can be set to the name of an
+    available poller to override the choice.
+
+    :rtype: class
+
+    """
+    name = os.environ.get('RABBITPY_POLLER')
+    if name:
+        if name in POLLERS and (name == 'select' or hasattr(select, name)):
+            return POLLERS[name]
+        LOGGER.warning('Ignoring unavailable RABBITPY_POLLER: %s', name)
+    for name in ['epoll', 'kqueue', 'poll']:
+        if hasattr(select, name):
+            return POLLERS[name]
+    return _SelectPoller
+
+
+_POLLER = _get_poller_class()
+
+
+class _ReadBuffer(object):
+    """Preallocated buffer the IOLoop reads socket data into and IO decodes
+    frames out of. Read and write positions are tracked so that data is not
+    copied as frames are consumed, with the unread data only moved to the
+    front of the buffer when there is not enough room left to read into.
+
+    :param int size: The initial size of the buffer
+
+    """
+    def __init__(self, size):
+        self._data = bytearray(size)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def consume(self, byte_count):
+        """Mark bytes at the front of the unread data as consumed.
+
+        :param int byte_count: The number of bytes consumed
+
+        """
+        self._start += byte_count
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def readable(self):
+        """Return a view of the unread data. The view must be released before
+        reading more data into the buffer.
+
+        :rtype: memoryview
+
+        """
+        return memoryview(self._data)[self._start:self._end]
+
+    def writable(self, size):
+        """Return a view of the buffer to read up to ``size`` bytes into,
+        making room for them if needed. The view must be released before
+        calling :meth:`written`.
+
+        :param int size: The number of bytes to make room for
+        :rtype: memoryview
+
+        """
+        if len(self._data) - self._end < size:
+            if self._start:
+                unread = self._end - self._start
+                with memoryview(self._data) as view:
+                    view[:unread] = view[self._start:self._end]
+                self._start, self._end = 0, unread
+            if len(self._data) - self._end < size:
+                self._data.extend(bytes(size))
+        return memoryview(self._data)[self._end:self._end + size]
+
+    def written(self, byte_count):
+        """Mark bytes read into the view returned by :meth:`writable` as
+        unread data.
+
+        :param int byte_count: The number of bytes read into the buffer
+
+        """
+        self._end += byte_count
 
 
 class _IOLoop(object):
     """Generic base IOLoop implementation that leverages different types of
-    Polling (select, KQueue, poll).
+    Polling (select, KQueue, poll, epoll).
 
     """
     def __init__(self, fd, error_callback, read_callback, write_callback,
-                 write_queue, event_obj, write_trigger, exception_stack):
-        self._data = threading.local()
-        self._data.fd = fd
-        self._data.error_callback = error_callback
-        self._data.read_callback = read_callback
-        self._data.running = False
-        self._data.ssl = hasattr(fd, 'read')
-        self._data.events = event_obj
-        self._data.write_buffer = collections.deque()
-        self._data.write_callback = write_callback
-        self._data.write_queue = write_queue
-        self._data.write_trigger = write_trigger
+                 write_queue, event_obj, write_trigger, exception_stack,
+                 read_buffer):
+        self._fd = fd
+        self._fd_no = fd.fileno()
+        self._error_callback = error_callback
+        self._read_buffer = read_buffer
+        self._read_callback = read_callback
+        self._read_pending = False
+        self._running = False
+        self._ssl = hasattr(fd, 'read')
+        self._recv_into = fd.recv_into
+        if self._ssl:
+            self._pending = self._ssl_pending
+        else:
+            self._pending = self._socket_pending
+        self._probe = self._create_probe()
+        if not self._ssl and hasattr(fd, 'sendmsg'):
+            self._send = fd.sendmsg
+        else:
+            self._send = self._send_joined
+        if self._ssl:
+            # SSL sockets wait until all of the data passed to send is
+            # written, so they are only written to when the poller says so
+            self._send_nowait = None
+        elif POSIX and fd.gettimeout() is not None:
+            self._send_nowait = self._writev
+        else:
+            self._send_nowait = self._send_if_writable
+        self._events = event_obj
+        self._write_buffer = collections.deque()
+        self._write_callback = write_callback
+        self._write_queue = write_queue
+        self._write_trigger = write_trigger
+        self._writable = True
+        self._trigger_no = write_trigger.fileno()
         self._server_sock = None
         self._exceptions = exception_stack
         self._poller = self._create_poller()
@@ -201,116 +419,295 @@ class _IOLoop(object):
         another exception.
 
         """
-        self._data.running = True
-        while self._data.running:
-            try:
-                self._poll()
-            except EnvironmentError as exception:
-                if getattr(exception, 'errno') == errno.EINTR:
-                    continue
-                elif (isinstance(getattr(exception, 'args'), tuple) and
-                      len(exception.args) == 2 and
-                      exception.args[0] == errno.EINTR):
-                    continue
-            if self._data.events.is_set(events.SOCKET_CLOSED):
-                LOGGER.debug('Exiting due to closed socket')
-                break
-            elif self._data.events.is_set(events.SOCKET_CLOSE):
-                LOGGER.debug('Exiting due to closing socket')
-                self._exceptions.put(exceptions.ConnectionResetException())
-                break
+        self._running = True
+        try:
+            while self._running:
+                try:
+                    self._poll()
+                except EnvironmentError as exception:
+                    if getattr(exception, 'errno') == errno.EINTR:
+                        continue
+                    elif (isinstance(getattr(exception, 'args'), tuple) and
+                          len(exception.args) == 2 and
+                          exception.args[0] == errno.EINTR):
+                        continue
+                if self._events.is_set(events.SOCKET_CLOSED):
+                    LOGGER.debug('Exiting due to closed socket')
+                    break
+                elif self._events.is_set(events.SOCKET_CLOSE):
+                    LOGGER.debug('Exiting due to closing socket')
+                    self._exceptions.put(
+                        exceptions.ConnectionResetException())
+                    break
+        finally:
+            self._poller.close()
         LOGGER.debug('Exiting IOLoop.run')
 
     def stop(self):
         """Stop the IOLoop."""
         LOGGER.debug('Stopping IOLoop')
-        self._data.running = False
+        self._running = False
         try:
-            self._data.write_trigger.close()
+            self._write_trigger.close()
         except socket.error:
             pass
 
     def _create_poller(self):
-        if hasattr(select, 'kqueue'):
-            LOGGER.debug('Returning KQueuePoller')
-            return _KQueuePoller(self._data.fd, self._data.write_trigger)
-        elif hasattr(select, 'poll'):
-            LOGGER.debug('Returning PollPoller')
-            return _PollPoller(self._data.fd, self._data.write_trigger)
-        else:
-            LOGGER.debug('Returning SelectPoller')
-            return _SelectPoller(self._data.fd, self._data.write_trigger)
+        LOGGER.debug('Returning %s', _POLLER.__name__)
+        return _POLLER(self._fd, self._write_trigger)
+
+    def _create_probe(self):
+        """Return a poll object used to check if the socket can be read from
+        or written to without blocking. Returns None where poll is not
+        available, in which case select is used instead.
+
+        poll is preferred since select can not check file descriptors above
+        ``FD_SETSIZE`` on POSIX platforms.
+
+        :rtype: select.poll|None
+
+        """
+        if not hasattr(select, 'poll'):
+            return None
+        probe = select.poll()
+        probe.register(self._fd_no, select.POLLIN | select.POLLOUT)
+        return probe
 
     def _poll(self):
         # Poll select with the materialized lists
-        if not self._data.running:
+        if not self._running:
             LOGGER.debug('Exiting poll')
 
-        # Build the outbound write buffer of marshalled frames
-        while not self._data.write_queue.empty():
-            data = self._data.write_queue.get(False)
-            self._data.write_buffer.append(frame.marshal(data[1], data[0]))
+        self._fill_write_buffer()
+
+        # Skip waiting on the poller while the socket still has data to read
+        # or accepted everything written to it last time
+        for _unused in range(MAX_BUSY_POLL):
+            read = self._read_pending
+            write = (self._writable and self._send_nowait is not None and
+                     bool(self._write_buffer))
+            if not read and not write:
+                break
+            if read:
+                self._read()
+            if write:
+                self._write(True)
+            self._fill_write_buffer()
 
         # Poll the poller, passing in a bool if there is data to write
-        rlist, wlist, xlist = self._poller.poll(bool(self._data.write_buffer))
+        rlist, wlist, xlist = self._poller.poll(bool(self._write_buffer))
 
         if xlist:
             LOGGER.debug('Poll errors: %r', xlist)
-            self._data.events.set(events.SOCKET_CLOSE)
-            self._data.error_callback('Connection reset')
+            self._events.set(events.SOCKET_CLOSE)
+            self._error_callback('Connection reset')
             return
 
         # Clear out the trigger socket
-        if self._data.write_trigger.fileno() in rlist:
-            self._data.write_trigger.recv(1024)
+        if self._trigger_no in rlist:
+            self._clear_trigger()
 
         # Read if the data socket is in the read list
-        if self._data.fd.fileno() in rlist:
+        if self._fd_no in rlist:
             self._read()
 
         # Write if the data socket is writable
-        if wlist and self._data.write_buffer:
+        if wlist and self._write_buffer:
             self._write()
 
+    def _fill_write_buffer(self):
+        """Move up to ``MAX_WRITE_BATCH`` marshalled frames from the write
+        queue to the outbound write buffer.
+
+        """
+        for _unused in range(MAX_WRITE_BATCH):
+            try:
+                self._write_buffer.append(self._write_queue.popleft())
+            except IndexError:
+                break
+
     def _read(self):
-        if not self._data.running:
+        self._read_pending = False
+        if not self._running:
             LOGGER.debug('Skipping read, not running')
             return
         try:
-            if self._data.ssl:
-                self._data.read_callback(self._data.fd.read(MAX_READ))
+            for _unused in range(MAX_READ_BATCH):
+                with self._read_buffer.writable(MAX_READ) as view:
+                    bytes_read = self._recv_into(view, MAX_READ)
+                self._read_buffer.written(bytes_read)
+                self._read_callback(bytes_read)
+                if not bytes_read or not self._pending(bytes_read):
+                    break
             else:
-                self._data.read_callback(self._data.fd.recv(MAX_READ))
+                # The batch ran out while the socket still has data ready
+                self._read_pending = True
         except socket.timeout:
             LOGGER.warning('Timed out reading from socket')
         except socket.error as exception:
-            self._data.running = False
-            self._data.error_callback(exception)
+            self._running = False
+            self._error_callback(exception)
+
+    def _socket_pending(self, bytes_read):
+        """Return True if the last read filled the read size and the socket
+        still has data ready to be read without blocking.
+
+        :param int bytes_read: The number of bytes returned by the last read
+        :rtype: bool
+
+        """
+        if bytes_read < MAX_READ:
+            return False
+        if self._probe is None:
+            return bool(select.select([self._fd_no], [], [], 0)[0])
+        return any(event & select.POLLIN for _fd, event in self._probe.poll(0))
+
+    def _socket_writable(self):
+        """Return True if the socket can be written to without blocking.
+
+        :rtype: bool
 
-    def _write(self):
-        if not self._data.running:
+        """
+        if self._probe is None:
+            return bool(select.select([], [self._fd_no], [], 0)[1])
+        return any(event & select.POLLOUT
+                   for _fd, event in self._probe.poll(0))
+
+    def _ssl_pending(self, _bytes_read):
+        """Return True if the SSL socket has decrypted data buffered that can
+        be read without waiting on the socket.
+
+        :param int _bytes_read: The number of bytes returned by the last read
+        :rtype: bool
+
+        """
+        return self._fd.pending() > 0
+
+    def _clear_trigger(self):
+        """Read the pending notification bytes from the write trigger socket,
+        using the file descriptor directly where the platform allows it.
+
+        """
+        try:
+            if POSIX:
+                os.read(self._trigger_no, TRIGGER_READ)
+            else:
+                self._write_trigger.recv(TRIGGER_READ)
+        except (IOError, OSError) as error:
+            if error.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+
+    def _pop_frames(self):
+        """Pop up to ``MAX_WRITE_VECTORS`` marshalled frames totaling up to
+        ``MAX_WRITE`` bytes off of the write buffer so that they can be sent
+        with a single call to the socket.
+
+        :rtype: list
+
+        """
+        frame_data = [self._write_buffer.popleft()]
+        size = len(frame_data[0])
+        while (self._write_buffer and
+               len(frame_data) < MAX_WRITE_VECTORS and
+               size + len(self._write_buffer[0]) <= MAX_WRITE):
+            frame_data.append(self._write_buffer.popleft())
+            size += len(frame_data[-1])
+        return frame_data
+
+    def _requeue_unsent(self, frame_data, bytes_sent):
+        """Put the frame data that was not sent back at the front of the
+        write buffer, preserving the order it was to be written in.
+
+        :param list frame_data: The frame data that was to be sent
+        :param int bytes_sent: The number of bytes that were sent
+
+        """
+        for offset, value in enumerate(frame_data):
+            if bytes_sent < len(value):
+                break
+            bytes_sent -= len(value)
+        else:
+            return
+        self._write_buffer.extendleft(reversed(frame_data[offset + 1:]))
+        self._write_buffer.appendleft(
+            value[bytes_sent:] if bytes_sent else value)
+
+    def _send_joined(self, frame_data):
+        """Send the frame data as a single value for sockets that do not
+        support ``socket.sendmsg``, such as SSL sockets.
+
+        :param list frame_data: The frame data to send
+        :rtype: int
+
+        """
+        return self._fd.send(b''.join(frame_data))
+
+    def _send_if_writable(self, frame_data):
+        """Send the frame data if the socket can be written to, raising
+        ``EAGAIN`` if it can not. Used for plain sockets that can not be
+        written to with ``os.writev``. Their send returns once the data that
+        fits in the socket buffer is written, so it does not wait once the
+        socket is writable. This is not the case for SSL sockets, which are
+        not written to without the poller.
+
+        :param list frame_data: The frame data to send
+        :rtype: int
+        :raises: socket.error
+
+        """
+        if not self._socket_writable():
+            raise socket.error(errno.EAGAIN, os.strerror(errno.EAGAIN))
+        return self._send(frame_data)
+
+    def _writev(self, frame_data):
+        """Write the frame data directly to the file descriptor of a socket
+        in timeout mode. The descriptor is non-blocking, so unlike the socket
+        methods, which wait up to the timeout for the socket to be writable,
+        this raises ``EAGAIN`` when the socket buffer is full.
+
+        :param list frame_data: The frame data to send
+        :rtype: int
+        :raises: BlockingIOError
+
+        """
+        return os.writev(self._fd_no, frame_data)
+
+    def _write(self, nowait=False):
+        """Write the pending frame data to the socket. When ``nowait`` is
+        True, the socket has not been reported as writable by the poller and
+        the write is made without blocking.
+
+        :param bool nowait: Do not block if the socket can not be written to
+
+        """
+        if not self._running:
             LOGGER.debug('Skipping write frame, not running')
             return
 
-        frame_data = self._data.write_buffer.popleft()
+        frame_data = self._pop_frames()
+        self._writable = False
         try:
-            bytes_sent = self._data.fd.send(frame_data)
+            if nowait:
+                bytes_sent = self._send_nowait(frame_data)
+            else:
+                bytes_sent = self._send(frame_data)
         except socket.timeout:
             LOGGER.warning('Timed out writing %i bytes to socket',
-                           len(frame_data))
-            self._data.write_buffer.appendleft(frame_data)
+                           sum(len(value) for value in frame_data))
+            self._requeue_unsent(frame_data, 0)
         except socket.error as error:
-            if error.errno == 35:
+            if error.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
                 LOGGER.debug('socket resource temp unavailable')
-                self._data.write_buffer.appendleft(frame_data)
+                self._requeue_unsent(frame_data, 0)
             else:
-                self._data.running = False
-                self._data.error_callback(error)
+                self._running = False
+                self._error_callback(error)
         else:
-            self._data.write_callback(bytes_sent)
-            # If the entire frame could not be send, send the rest next time
-            if bytes_sent < len(frame_data):
-                self._data.write_buffer.appendleft(frame_data[bytes_sent:])
+            self._write_callback(bytes_sent)
+            # Only write again without polling if the socket took everything
+            self._writable = bytes_sent == sum(len(v) for v in frame_data)
+            # If all of the data could not be sent, send the rest next time
+            self._requeue_unsent(frame_data, bytes_sent)
 
 
 class IO(threading.Thread, base.StatefulObject):
@@ -350,7 +747,7 @@ class IO(threading.Thread, base.StatefulObject):
         self._bytes_read = 0
         self._bytes_written = 0
 
-        self._buffer = bytes()
+        self._buffer = _ReadBuffer(2 * MAX_READ)
         self._lock = threading.RLock()
         self._channels = dict()
         self._remote_name = None
@@ -358,15 +755,22 @@ class IO(threading.Thread, base.StatefulObject):
         self._state = None
         self._loop = None
 
-    def add_channel(self, channel, write_queue):
+    def add_channel(self, channel, write_queue, on_frame_callback=None):
         """Add a channel to the channel queue dict for dispatching frames
-        to the channel.
+        to the channel. If a callback is passed in, it is invoked in the IO
+        thread with each frame received on the channel instead of the frame
+        being added to the queue.
+
+        Only Channel0 registers a callback, since it handles its frames in
+        the IO thread. Regular channels always receive frames on their queue,
+        which consumers block on while waiting for messages.
 
         :param rabbitpy.channel.Channel channel: The channel to add
         :param Queue.Queue write_queue: Queue for sending frames to the channel
+        :param callable on_frame_callback: Invoked with each received frame
 
         """
-        self._channels[int(channel)] = channel, write_queue
+        self._channels[int(channel)] = channel, write_queue, on_frame_callback
 
     @property
     def bytes_received(self):
@@ -407,7 +811,7 @@ class IO(threading.Thread, base.StatefulObject):
         self._loop = _IOLoop(
             self._socket, self.on_error, self.on_read, self.on_write,
             self._write_queue, self._events, self._write_listener,
-            self._exceptions)
+            self._exceptions, self._buffer)
         self._loop.run()
         if not self._exceptions.empty() and \
                 not self._events.is_set(events.EXCEPTION_RAISED):
@@ -431,35 +835,27 @@ class IO(threading.Thread, base.StatefulObject):
             self._exceptions.put(exceptions.ConnectionException(*args))
         self._events.set(events.EXCEPTION_RAISED)
 
-    def on_read(self, data):
-        """Append the data that is read to the buffer and try and parse
-        frames out of it.
+    def on_read(self, bytes_read):
+        """Try and parse frames out of the buffer after data has been read
+        into it.
 
-        :param bytes data: The data that has been read in
+        :param int bytes_read: The number of bytes read into the buffer
 
         """
-        self._buffer += data
+        # Increment the byte counter used by the heartbeat timer
+        self._bytes_read += bytes_read
 
         while self._buffer:
 
             # Read and process data
             value = self._read_frame()
 
-            # Increment the byte counter used by the heartbeat timer
-            self._bytes_read += len(value)
-
             # Break out if a frame could not be decoded
-            if self._buffer and value[0] is None:
+            if value[0] is None:
                 break
 
             # LOGGER.debug('Received (%i) %r', value[0], value[1])
 
-            # If it's channel 0, call the Channel0 directly
-            if value[0] == 0:
-                with self._lock:
-                    self._channels[0][0].on_frame(value[1])
-                continue
-
             self._add_frame_to_read_queue(value[0], value[1])
 
     def on_write(self, bytes_written):
@@ -485,7 +881,8 @@ class IO(threading.Thread, base.StatefulObject):
 
     def _add_frame_to_read_queue(self, channel_id, frame_value):
         """Add the frame to the stack by creating the key value used in
-        expectations and then add it to the list.
+        expectations and then add it to the list, or pass it directly to the
+        channel's frame callback if it has one (such as Channel0).
 
         :param int channel_id: The channel id the frame was received on
         :param frame_value: The frame to add
@@ -493,7 +890,12 @@ class IO(threading.Thread, base.StatefulObject):
 
         """
         # LOGGER.debug('Adding %s to channel %s', frame_value.name, channel_id)
-        self._channels[channel_id][1].put(frame_value)
+        _channel, read_queue, on_frame_callback = self._channels[channel_id]
+        if on_frame_callback:
+            with self._lock:
+                on_frame_callback(frame_value)
+        else:
+            read_queue.put(frame_value)
 
     def _close(self):
         """Close the socket and set the proper event states"""
@@ -601,25 +1003,54 @@ class IO(threading.Thread, base.StatefulObject):
         return res
 
     @staticmethod
-    def _get_frame_from_str(value):
-        """Get the pamqp frame from the string value.
+    def _get_frame_from_str(view):
+        """Get the pamqp frame from the start of the view of unread data. Only
+        the bytes of the frame being decoded are copied out of the buffer.
 
-        :param str value: The value to parse for an pamqp frame
-        :return (str, int, pamqp.specification.Frame): Remainder of value,
+        :param memoryview view: The view of the data to parse
+        :return (int, int, pamqp.specification.Frame): Bytes consumed,
                                                        channel id and
                                                        frame value
         """
-        if not value:
-            return value, None, None
+        frame_header = IO._get_frame_header(view)
+        if not frame_header:
+            return 0, None, None
+        frame_type, channel_id, byte_count = frame_header
+
+        # Body frames have no payload to decode, so skip pamqp for them
+        if (frame_type == specification.FRAME_BODY and
+                view[byte_count - 1] == specification.FRAME_END):
+            return byte_count, channel_id, body.ContentBody(
+                bytes(view[frame.FRAME_HEADER_SIZE:byte_count - 1]))
+        value = bytes(view[:byte_count])
         try:
             byte_count, channel_id, frame_in = frame.unmarshal(value)
         except pamqp_exceptions.UnmarshalingException:
-            return value, None, None
+            return 0, None, None
         except specification.AMQPFrameError as error:
             LOGGER.error('Failed to demarshal: %r', error, exc_info=True)
             LOGGER.debug(value)
-            return value, None, None
-        return value[byte_count:], channel_id, frame_in
+            return 0, None, None
+        return byte_count, channel_id, frame_in
+
+    @staticmethod
+    def _get_frame_header(view):
+        """Return the frame type, channel id and total size of the frame at
+        the start of the view or ``None`` if the whole frame has not been
+        received yet.
+
+        :param memoryview view: The view of the data to inspect
+        :rtype: (int, int, int) or None
+
+        """
+        if view[:4] == frame.AMQP:
+            frame_type, channel_id, size = None, 0, 8
+        elif len(view) < frame.FRAME_HEADER_SIZE:
+            return None
+        else:
+            frame_type, channel_id, frame_size = FRAME_HEADER.unpack_from(view)
+            size = frame.FRAME_HEADER_SIZE + frame_size + 1
+        return (frame_type, channel_id, size) if size <= len(view) else None
 
     def _read_frame(self):
         """Read from the buffer and try and get the demarshaled frame.
@@ -627,7 +1058,9 @@ class IO(threading.Thread, base.StatefulObject):
         :rtype (int, pamqp.specification.Frame): The channel and frame
 
         """
-        self._buffer, chan_id, value = self._get_frame_from_str(self._buffer)
+        with self._buffer.readable() as view:
+            byte_count, chan_id, value = self._get_frame_from_str(view)
+        self._buffer.consume(byte_count)
         return chan_id, value
 
     def _remote_close_channel(self, channel_id, frame_value):
@@ -6,9 +6,10 @@ acknowledging it.
 
 """
 import datetime
+import itertools
 import json
 import logging
-import math
+import os
 import time
 import pprint
 import uuid
@@ -23,6 +24,40 @@ from rabbitpy import utils
 
 LOGGER = logging.getLogger(__name__)
 
+_VALID_PROPERTIES = frozenset(specification.Basic.Properties.attributes())
+
+
+class _MessageIdSequence(object):
+    """Generates unique message ids from a random per-process prefix and an
+    incrementing counter, avoiding the cost of creating a UUID per message.
+
+    """
+    def __init__(self):
+        self._counter = None
+        self._prefix = None
+        self.reset()
+
+    def next(self):
+        """Return the next message id in the sequence.
+
+        :rtype: str
+
+        """
+        return '%s-%x' % (self._prefix, next(self._counter))
+
+    def reset(self):
+        """Start a new sequence with a new prefix, used after forking so that
+        the parent and child processes do not generate the same ids.
+
+        """
+        self._counter = itertools.count()
+        self._prefix = uuid.uuid4().hex
+
+
+_MESSAGE_IDS = _MessageIdSequence()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_MESSAGE_IDS.reset)
+
 
 # Python 2.6 does not have a memoryview object, create dummy for isinstance
 try:
@@ -75,8 +110,11 @@ class Message(base.AMQPClass):
     will be set on the message properties.
 
     When publishing a message to RabbitMQ, if the opinionated value is ``True``
-    and no ``message_id`` value was passed in as a property, a UUID will be
-    generated and specified as a property of the message.
+    and no ``message_id`` value was passed in as a property, a unique id will
+    be generated and specified as a property of the message. The id is made
+    up of a random per-process prefix and a counter. If ``uuid_message_id``
+    is ``True``, a UUID string is generated for the id instead, matching the
+    ids generated by earlier versions.
 
     Additionally, if opinionated is ``True`` and the ``timestamp`` property
     is not specified when passing in ``properties``, the current Unix epoch
@@ -93,6 +131,7 @@ class Message(base.AMQPClass):
     :param dict properties: A dictionary of message properties
     :param bool auto_id: Add a message id if no properties were passed in.
     :param bool opinionated: Automatically populate properties if True
+    :param bool uuid_message_id: Use a UUID for the automatic message id
     :raises KeyError: Raised when an invalid property is passed in
 
     """
@@ -100,13 +139,16 @@ class Message(base.AMQPClass):
     name = 'Message'
 
     def __init__(self, channel, body_value, properties=None, auto_id=False,
-                 opinionated=False):
+                 opinionated=False, uuid_message_id=False):
         """Create a new instance of the Message object."""
         super(Message, self).__init__(channel, 'Message')
 
         # Always have a dict of properties set
         self.properties = properties or {}
 
+        # The properties dict and Basic.Properties built from it on publish
+        self._cached_properties = None
+
         # Assign the body value
         if isinstance(body_value, memoryview):
             self.body = bytes(body_value)
@@ -118,7 +160,7 @@ class Message(base.AMQPClass):
         if (opinionated or auto_id) and 'message_id' not in self.properties:
             if auto_id:
                 raise DeprecationWarning('Use opinionated instead of auto_id')
-            self._add_auto_message_id()
+            self._add_auto_message_id(uuid_message_id)
 
         if opinionated:
             if 'timestamp' not in self.properties:
@@ -268,17 +310,15 @@ class Message(base.AMQPClass):
                   header.ContentHeader(body_size=len(payload),
                                        properties=self._properties)]
 
-        # Calculate how many body frames are needed
-        pieces = int(math.ceil(len(payload) /
-                               float(self.channel.maximum_frame_size)))
-
-        # Send the message
-        for offset in range(0, pieces):
-            start = self.channel.maximum_frame_size * offset
-            end = start + self.channel.maximum_frame_size
-            if end > len(payload):
-                end = len(payload)
-            frames.append(body.ContentBody(payload[start:end]))
+        # Split the body into frames, slicing a view of it to avoid copies
+        frame_size = self.channel.maximum_frame_size
+        if len(payload) <= frame_size:
+            if payload:
+                frames.append(body.ContentBody(payload))
+        else:
+            view = memoryview(bytes(payload))
+            frames += [body.ContentBody(view[offset:offset + frame_size])
+                       for offset in range(0, len(payload), frame_size)]
 
         # Write the frames out
         self.channel.write_frames(frames)
@@ -308,9 +348,16 @@ class Message(base.AMQPClass):
                                                   requeue=requeue)
         self.channel.write_frame(basic_reject)
 
-    def _add_auto_message_id(self):
-        """Set the message_id property to a new UUID."""
-        self.properties['message_id'] = str(uuid.uuid4())
+    def _add_auto_message_id(self, use_uuid=False):
+        """Set the message_id property to a new unique id.
+
+        :param bool use_uuid: Generate a UUID string instead of a sequence id
+
+        """
+        if use_uuid:
+            self.properties['message_id'] = str(uuid.uuid4())
+        else:
+            self.properties['message_id'] = _MESSAGE_IDS.next()
 
     def _add_timestamp(self):
         """Add the timestamp to the properties"""
@@ -394,19 +441,25 @@ class Message(base.AMQPClass):
 
         """
         return [key for key in self.properties
-                if key not in specification.Basic.Properties.attributes()]
+                if key not in _VALID_PROPERTIES]
 
     @property
     def _properties(self):
-        """Return a new Basic.Properties object representing the message
-        properties.
+        """Return a Basic.Properties object representing the message
+        properties, reusing the previously built object if the properties
+        have not changed since.
 
         :rtype: pamqp.specification.Basic.Properties
 
         """
+        if (self._cached_properties and
+                self._cached_properties[0] == self.properties):
+            return self._cached_properties[1]
         self._prune_invalid_properties()
         self._coerce_properties()
-        return specification.Basic.Properties(**self.properties)
+        value = specification.Basic.Properties(**self.properties)
+        self._cached_properties = dict(self.properties), value
+        return value
 
     def _prune_invalid_properties(self):
         """Remove invalid properties from the message properties."""
@@ -9,6 +9,7 @@ try:
     import Queue as queue
 except ImportError:
     import queue
+import os
 import platform
 import socket
 # pylint: disable=import-error
@@ -19,6 +20,7 @@ except ImportError:
 
 from pamqp import PYTHON3
 
+POSIX = os.name == 'posix'
 PYPY = platform.python_implementation() == 'PyPy'
 
 Parsed = collections.namedtuple('Parsed',
@@ -94,10 +96,21 @@ def is_string(value):
 
 def trigger_write(sock):
     """Notifies the IO loop we need to write a frame by writing a byte
-    to a local socket.
+    to a local socket. On POSIX platforms the byte is written to the file
+    descriptor directly.
+
+    The descriptor is looked up on each call since it is -1 once the socket
+    is closed, so a closed socket can not write to a reused descriptor. A
+    full socket buffer is ignored since the IO loop already has a pending
+    notification to wake up for.
+
+    :param socket.socket sock: The socket to write to
 
     """
     try:
-        sock.send(b'0')
+        if POSIX:
+            os.write(sock.fileno(), b'0')
+        else:
+            sock.send(b'0')
     except socket.error:
         pass
@@ -2,6 +2,9 @@
 Test the rabbitpy.base classes
 
 """
+from pamqp import frame
+from pamqp import specification
+
 from rabbitpy import base, utils
 
 from tests import helpers
@@ -35,3 +38,18 @@ class AMQPClassTests(helpers.TestCase):
 
     def test_name_invalid(self):
         self.assertRaises(ValueError, base.AMQPClass, self.channel, 1)
+
+
+class AMQPChannelWriteTests(helpers.TestCase):
+
+    def test_write_frame_enqueues_marshalled_frame(self):
+        value = specification.Basic.Ack(1)
+        self.channel.write_frame(value)
+        self.assertEqual(list(self.channel._write_queue),
+                         [frame.marshal(value, 1)])
+
+    def test_write_frames_enqueues_marshalled_frames(self):
+        values = [specification.Basic.Ack(1), specification.Basic.Ack(2)]
+        self.channel.write_frames(values)
+        self.assertEqual(list(self.channel._write_queue),
+                         [frame.marshal(value, 1) for value in values])
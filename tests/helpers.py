@@ -3,6 +3,9 @@ try:
 except ImportError:
     import unittest
 
+import collections
+import socket
+
 import mock
 
 from rabbitpy import channel, connection, events
@@ -13,8 +16,11 @@ class TestCase(unittest.TestCase):
     def setUp(self):
         self.connection = mock.MagicMock('rabbitpy.connection.Connection')
         self.connection._io = mock.Mock()
-        self.connection._io.write_trigger = mock.Mock('socket.socket')
-        self.connection._io.write_trigger.send = mock.Mock()
+        self.write_listener, self.write_trigger = socket.socketpair()
+        self.write_trigger.setblocking(0)
+        self.addCleanup(self.write_listener.close)
+        self.addCleanup(self.write_trigger.close)
+        self.connection._io.write_trigger = self.write_trigger
         self.connection._channel0 = mock.Mock()
         self.connection._channel0.properties = {}
         self.connection._events = events.Events()
@@ -25,7 +31,7 @@ class TestCase(unittest.TestCase):
                                        self.connection._events,
                                        self.connection._exceptions,
                                        connection.queue.Queue(),
-                                       connection.queue.Queue(), 32768,
+                                       collections.deque(), 32768,
                                        self.connection._io.write_trigger,
                                        connection=self.connection)
         self.channel._set_state(self.channel.OPEN)
\ No newline at end of file
@@ -0,0 +1,520 @@
+"""
+Test the rabbitpy.io classes
+
+"""
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import collections
+import errno
+import os
+import select
+import socket
+import time
+
+import mock
+from pamqp import body
+from pamqp import frame
+from pamqp import header
+from pamqp import heartbeat
+from pamqp import specification
+
+from rabbitpy import events
+from rabbitpy import io
+from rabbitpy.utils import queue
+
+
+class IOReadTests(unittest.TestCase):
+
+    def setUp(self):
+        self.io = io.IO(kwargs={'connection_args': {},
+                                'events': events.Events(),
+                                'exceptions': queue.Queue(),
+                                'write_queue': collections.deque()})
+        self.channel0 = mock.Mock()
+        self.read_queue = queue.Queue()
+        self.io.add_channel(0, None, self.channel0.on_frame)
+        self.io.add_channel(1, self.read_queue)
+        self.frames = [
+            frame.marshal(specification.Basic.Deliver('ctag', 1, False,
+                                                      'ex', 'rk'), 1),
+            frame.marshal(header.ContentHeader(0, 3), 1),
+            frame.marshal(body.ContentBody(b'abc'), 1)]
+
+    def tearDown(self):
+        self.io.stop()
+
+    def _on_read(self, data):
+        with self.io._buffer.writable(len(data)) as view:
+            view[:len(data)] = data
+        self.io._buffer.written(len(data))
+        self.io.on_read(len(data))
+
+    def _read_queue_values(self):
+        values = []
+        while not self.read_queue.empty():
+            values.append(self.read_queue.get(False))
+        return values
+
+    def test_on_read_dispatches_all_frames(self):
+        self._on_read(b''.join(self.frames))
+        values = self._read_queue_values()
+        self.assertIsInstance(values[0], specification.Basic.Deliver)
+        self.assertIsInstance(values[1], header.ContentHeader)
+        self.assertEqual(values[2].value, b'abc')
+
+    def test_on_read_consumes_buffer(self):
+        self._on_read(b''.join(self.frames))
+        self.assertEqual(len(self.io._buffer), 0)
+
+    def test_on_read_counts_bytes_received(self):
+        self._on_read(b''.join(self.frames))
+        self.assertEqual(self.io.bytes_received, len(b''.join(self.frames)))
+
+    def test_on_read_with_partial_frame(self):
+        data = b''.join(self.frames)
+        self._on_read(data[:-4])
+        self.assertEqual(len(self._read_queue_values()), 2)
+        self._on_read(data[-4:])
+        self.assertEqual(self._read_queue_values()[0].value, b'abc')
+
+    def test_on_read_byte_at_a_time(self):
+        data = b''.join(self.frames)
+        for offset in range(0, len(data)):
+            self._on_read(data[offset:offset + 1])
+        self.assertEqual(len(self._read_queue_values()), 3)
+
+    def test_on_read_does_not_queue_frame_with_callback(self):
+        callback = mock.Mock()
+        self.io.add_channel(1, self.read_queue, callback)
+        self._on_read(b''.join(self.frames))
+        self.assertEqual(callback.call_count, 3)
+        self.assertTrue(self.read_queue.empty())
+
+    def test_get_frame_from_str_body_frame_skips_unmarshal(self):
+        view = memoryview(b''.join(self.frames[2:]))
+        with mock.patch('pamqp.frame.unmarshal') as unmarshal:
+            value = self.io._get_frame_from_str(view)
+            unmarshal.assert_not_called()
+        self.assertEqual(value[0], len(view))
+        self.assertEqual(value[1], 1)
+        self.assertEqual(value[2].value, b'abc')
+
+    def test_on_read_heartbeat_invokes_channel0(self):
+        self._on_read(heartbeat.Heartbeat().marshal())
+        self.assertIsInstance(self.channel0.on_frame.mock_calls[0][1][0],
+                              heartbeat.Heartbeat)
+
+
+@unittest.skipUnless(hasattr(select, 'epoll'), 'epoll is not available')
+class EPollPollerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.fd, self.remote = socket.socketpair()
+        self.trigger, self.trigger_client = socket.socketpair()
+        self.poller = io._EPollPoller(self.fd, self.trigger)
+
+    def tearDown(self):
+        for sock in [self.fd, self.remote, self.trigger, self.trigger_client]:
+            sock.close()
+
+    def test_close_closes_epoll(self):
+        self.poller.close()
+        self.assertTrue(self.poller._epoll.closed)
+
+    def test_poll_returns_readable_fd(self):
+        self.remote.send(b'0')
+        rlist, wlist, xlist = self.poller.poll(False)
+        self.assertEqual(rlist, [self.fd.fileno()])
+        self.assertEqual(wlist, [])
+
+    def test_poll_returns_writable_fd(self):
+        rlist, wlist, xlist = self.poller.poll(True)
+        self.assertEqual(wlist, [self.fd.fileno()])
+
+    def test_poll_only_modifies_on_transition(self):
+        self.poller._epoll = mock.Mock()
+        self.poller._epoll.poll.return_value = []
+        for write_wanted in [True, True, True, False, False]:
+            self.poller.poll(write_wanted)
+        self.assertEqual(self.poller._epoll.modify.call_count, 2)
+
+
+class IOLoopWriteTests(unittest.TestCase):
+
+    def setUp(self):
+        self.fd, self.remote = socket.socketpair()
+        self.trigger, self.trigger_client = socket.socketpair()
+        self.write_queue = collections.deque()
+        self.loop = io._IOLoop(self.fd, mock.Mock(), mock.Mock(), mock.Mock(),
+                               self.write_queue, events.Events(),
+                               self.trigger, queue.Queue(),
+                               io._ReadBuffer(io.MAX_READ))
+
+    def tearDown(self):
+        for sock in [self.fd, self.remote, self.trigger, self.trigger_client]:
+            sock.close()
+
+    def test_run_closes_poller_on_exit(self):
+        self.loop._poller = mock.Mock()
+        self.loop._poller.poll.return_value = [], [], []
+        self.loop._events.set(events.SOCKET_CLOSED)
+        self.loop.run()
+        self.loop._poller.close.assert_called_once_with()
+
+    def test_pop_frames_returns_all_frames(self):
+        self.loop._write_buffer.extend([b'foo', b'bar', b'baz'])
+        self.assertEqual(self.loop._pop_frames(), [b'foo', b'bar', b'baz'])
+        self.assertFalse(self.loop._write_buffer)
+
+    def test_pop_frames_limits_size(self):
+        value = b'0' * (io.MAX_WRITE // 2)
+        self.loop._write_buffer.extend([value, value, b'1'])
+        self.assertEqual(self.loop._pop_frames(), [value, value])
+        self.assertEqual(list(self.loop._write_buffer), [b'1'])
+
+    def test_pop_frames_limits_count(self):
+        self.loop._write_buffer.extend(
+            [b'0'] * (io.MAX_WRITE_VECTORS + 1))
+        self.assertEqual(len(self.loop._pop_frames()), io.MAX_WRITE_VECTORS)
+        self.assertEqual(list(self.loop._write_buffer), [b'0'])
+
+    def test_plain_socket_uses_sendmsg(self):
+        self.assertEqual(self.loop._send, self.fd.sendmsg)
+
+    def test_write_sends_coalesced_frames(self):
+        frames = [frame.marshal(specification.Basic.Ack(tag), 1)
+                  for tag in range(1, 10)]
+        self.loop._running = True
+        self.loop._write_buffer.extend(frames)
+        self.loop._write()
+        self.assertEqual(self.remote.recv(io.MAX_WRITE), b''.join(frames))
+        self.loop._write_callback.assert_called_once_with(
+            len(b''.join(frames)))
+
+    def test_write_without_sendmsg_sends_coalesced_frames(self):
+        self.loop._running = True
+        self.loop._send = self.loop._send_joined
+        self.loop._write_buffer.extend([b'foo', b'bar'])
+        self.loop._write()
+        self.assertEqual(self.remote.recv(io.MAX_WRITE), b'foobar')
+
+    def test_write_all_sent_leaves_socket_writable(self):
+        self.loop._running = True
+        self.loop._write_buffer.extend([b'foo', b'bar'])
+        self.loop._write()
+        self.assertTrue(self.loop._writable)
+
+    def test_partial_write_waits_on_poller(self):
+        self.loop._running = True
+        self.loop._send = mock.Mock(return_value=4)
+        self.loop._write_buffer.extend([b'foo', b'bar'])
+        self.loop._write()
+        self.assertFalse(self.loop._writable)
+
+    def test_write_requeues_frames_on_eagain(self):
+        self.loop._running = True
+        self.loop._send = mock.Mock(
+            side_effect=socket.error(errno.EAGAIN, 'EAGAIN'))
+        self.loop._write_buffer.extend([b'foo', b'bar'])
+        self.loop._write()
+        self.assertEqual(list(self.loop._write_buffer), [b'foo', b'bar'])
+        self.assertFalse(self.loop._writable)
+        self.loop._error_callback.assert_not_called()
+
+    def test_poll_writes_without_polling_while_writable(self):
+        self.loop._running = True
+        self.loop._poller = mock.Mock()
+        self.loop._poller.poll.return_value = [], [], []
+        self.write_queue.append(frame.marshal(specification.Basic.Ack(1), 1))
+        self.loop._poll()
+        self.loop._poller.poll.assert_called_once_with(False)
+        self.assertEqual(self.remote.recv(io.MAX_WRITE),
+                         frame.marshal(specification.Basic.Ack(1), 1))
+
+    def _fill_socket(self):
+        self.fd.setblocking(False)
+        try:
+            while True:
+                self.fd.send(b'0' * 65536)
+        except socket.error:
+            pass
+
+    @unittest.skipUnless(io.POSIX, 'Requires a POSIX platform')
+    def test_timeout_socket_writes_without_waiting(self):
+        self.fd.settimeout(3)
+        loop = io._IOLoop(self.fd, mock.Mock(), mock.Mock(), mock.Mock(),
+                          self.write_queue, events.Events(),
+                          self.trigger, queue.Queue(),
+                          io._ReadBuffer(io.MAX_READ))
+        self.assertEqual(loop._send_nowait, loop._writev)
+
+    @unittest.skipUnless(io.POSIX, 'Requires a POSIX platform')
+    def test_poll_does_not_block_when_peer_stops_reading(self):
+        self._fill_socket()
+        self.fd.settimeout(3)
+        loop = io._IOLoop(self.fd, mock.Mock(), mock.Mock(), mock.Mock(),
+                          self.write_queue, events.Events(),
+                          self.trigger, queue.Queue(),
+                          io._ReadBuffer(io.MAX_READ))
+        loop._running = True
+        loop._poller = mock.Mock()
+        loop._poller.poll.return_value = [], [], []
+        loop._write_buffer.append(b'foo')
+        start = time.time()
+        loop._poll()
+        self.assertLess(time.time() - start, io.POLL_TIMEOUT)
+        self.assertEqual(list(loop._write_buffer), [b'foo'])
+        self.assertFalse(loop._writable)
+        loop._error_callback.assert_not_called()
+
+    def test_poll_does_not_write_ssl_socket_without_poller(self):
+        fd = mock.Mock()
+        fd.fileno.return_value = self.fd.fileno()
+        loop = io._IOLoop(fd, mock.Mock(), mock.Mock(), mock.Mock(),
+                          self.write_queue, events.Events(),
+                          self.trigger, queue.Queue(),
+                          io._ReadBuffer(io.MAX_READ))
+        loop._running = True
+        loop._poller = mock.Mock()
+        loop._poller.poll.return_value = [], [], []
+        loop._write_buffer.append(b'foo')
+        loop._poll()
+        self.assertIsNone(loop._send_nowait)
+        fd.send.assert_not_called()
+        loop._poller.poll.assert_called_once_with(True)
+
+    def test_send_if_writable_raises_eagain_when_full(self):
+        self._fill_socket()
+        with self.assertRaises(socket.error) as context:
+            self.loop._send_if_writable([b'foo'])
+        self.assertEqual(context.exception.errno, errno.EAGAIN)
+
+    def test_poll_busy_polls_a_bounded_number_of_times(self):
+        self.loop._running = True
+        self.loop._poller = mock.Mock()
+        self.loop._poller.poll.return_value = [], [], []
+        self.loop._write = mock.Mock()
+        self.loop._write_buffer.append(b'foo')
+        self.loop._poll()
+        self.assertEqual(self.loop._write.call_count, io.MAX_BUSY_POLL)
+        self.loop._poller.poll.assert_called_once_with(True)
+
+    def test_requeue_unsent_with_partial_frame(self):
+        self.loop._requeue_unsent([b'foo', b'bar', b'baz'], 4)
+        self.assertEqual(list(self.loop._write_buffer), [b'ar', b'baz'])
+
+    def test_requeue_unsent_with_all_sent(self):
+        self.loop._requeue_unsent([b'foo', b'bar'], 6)
+        self.assertFalse(self.loop._write_buffer)
+
+    def test_clear_trigger_reads_pending_bytes(self):
+        self.trigger_client.send(b'000')
+        self.loop._clear_trigger()
+        self.trigger.setblocking(0)
+        self.assertRaises(socket.error, self.trigger.recv, 1)
+
+    def test_clear_trigger_with_nothing_pending(self):
+        self.trigger.setblocking(0)
+        self.loop._clear_trigger()
+
+
+class KQueuePollerTests(unittest.TestCase):
+
+    def setUp(self):
+        for name in ['kqueue', 'kevent', 'KQ_FILTER_READ', 'KQ_FILTER_WRITE',
+                     'KQ_EV_ADD', 'KQ_EV_DELETE']:
+            patcher = mock.patch.object(select, name, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.poller = io._KQueuePoller(10, 11)
+        self.control = self.poller._kqueue.control
+
+    def _event(self, ident, event_filter, flags=0):
+        return mock.Mock(ident=ident, filter=event_filter, flags=flags)
+
+    def test_close_closes_kqueue(self):
+        self.poller.close()
+        self.poller._kqueue.close.assert_called_once_with()
+
+    def test_poll_without_events(self):
+        self.control.return_value = []
+        self.assertEqual(self.poller.poll(False), ([], [], []))
+
+    def test_poll_returns_read_and_write_events(self):
+        self.control.return_value = [
+            self._event(10, io._KQueuePoller.KQ_FILTER_READ),
+            self._event(11, io._KQueuePoller.KQ_FILTER_READ),
+            self._event(10, io._KQueuePoller.KQ_FILTER_WRITE)]
+        self.assertEqual(self.poller.poll(True), ([10, 11], [10], []))
+
+    def test_poll_returns_eof_as_error(self):
+        self.control.return_value = [
+            self._event(10, io._KQueuePoller.KQ_FILTER_READ,
+                        io._KQueuePoller.KQ_EV_EOF)]
+        self.assertEqual(self.poller.poll(False), ([10], [], [10]))
+
+    def test_poll_error_deletes_write_filter(self):
+        self.control.return_value = []
+        self.poller.poll(True)
+        self.control.reset_mock()
+        self.control.return_value = [
+            self._event(10, io._KQueuePoller.KQ_FILTER_READ,
+                        io._KQueuePoller.KQ_EV_EOF)]
+        self.poller.poll(True)
+        changelist = self.control.call_args_list[-1][0][0]
+        self.assertEqual(len(changelist), 3)
+        self.assertFalse(self.poller._write_in_last_poll)
+
+    def test_cleanup_ignores_control_errors(self):
+        self.control.side_effect = OSError(2, 'ENOENT')
+        self.poller._cleanup()
+        self.assertEqual(len(self.control.call_args[0][0]), 2)
+        self.assertFalse(self.poller._write_in_last_poll)
+
+
+class IOLoopReadTests(unittest.TestCase):
+
+    def setUp(self):
+        self.fd, self.remote = socket.socketpair()
+        self.trigger, self.trigger_client = socket.socketpair()
+        self.loop = io._IOLoop(self.fd, mock.Mock(), mock.Mock(), mock.Mock(),
+                               collections.deque(), events.Events(),
+                               self.trigger, queue.Queue(),
+                               io._ReadBuffer(io.MAX_READ))
+        self.loop._running = True
+
+    def tearDown(self):
+        for sock in [self.fd, self.remote, self.trigger, self.trigger_client]:
+            sock.close()
+
+    def test_read_passes_data_to_callback(self):
+        self.remote.send(b'foo')
+        self.loop._read()
+        self.loop._read_callback.assert_called_once_with(3)
+        with self.loop._read_buffer.readable() as view:
+            self.assertEqual(view.tobytes(), b'foo')
+
+    def test_read_continues_while_data_is_pending(self):
+        self.loop._recv_into = mock.Mock(side_effect=[3, 3])
+        self.loop._pending = mock.Mock(side_effect=[True, False])
+        self.loop._read()
+        self.assertEqual(self.loop._read_callback.call_count, 2)
+
+    def test_read_is_bounded_per_poll(self):
+        self.loop._recv_into = mock.Mock(return_value=3)
+        self.loop._pending = mock.Mock(return_value=True)
+        self.loop._read()
+        self.assertEqual(self.loop._read_callback.call_count,
+                         io.MAX_READ_BATCH)
+        self.assertTrue(self.loop._read_pending)
+
+    def test_read_without_pending_data_clears_read_pending(self):
+        self.loop._read_pending = True
+        self.remote.send(b'foo')
+        self.loop._read()
+        self.assertFalse(self.loop._read_pending)
+
+    def test_poll_reads_without_polling_while_data_is_pending(self):
+        self.loop._poller = mock.Mock()
+        self.loop._poller.poll.return_value = [], [], []
+        self.loop._read_pending = True
+        self.remote.send(b'foo')
+        self.loop._poll()
+        self.loop._read_callback.assert_called_once_with(3)
+        self.assertFalse(self.loop._read_pending)
+
+    def test_socket_pending_false_after_short_read(self):
+        self.remote.send(b'foo')
+        self.assertFalse(self.loop._socket_pending(3))
+
+    def test_socket_pending_true_after_full_read(self):
+        self.remote.send(b'foo')
+        self.assertTrue(self.loop._socket_pending(io.MAX_READ))
+
+    def test_socket_pending_false_without_data(self):
+        self.assertFalse(self.loop._socket_pending(io.MAX_READ))
+
+    @unittest.skipUnless(hasattr(select, 'poll'), 'Requires select.poll')
+    def test_socket_pending_with_high_file_descriptor(self):
+        try:
+            fd_no = os.dup2(self.fd.fileno(), 2000)
+        except OSError:
+            raise unittest.SkipTest('Can not open file descriptor 2000')
+        sock = socket.socket(fileno=fd_no)
+        self.addCleanup(sock.close)
+        loop = io._IOLoop(sock, mock.Mock(), mock.Mock(), mock.Mock(),
+                          collections.deque(), events.Events(),
+                          self.trigger, queue.Queue(),
+                          io._ReadBuffer(io.MAX_READ))
+        self.assertFalse(loop._socket_pending(io.MAX_READ))
+        self.remote.send(b'foo')
+        self.assertTrue(loop._socket_pending(io.MAX_READ))
+
+
+class ReadBufferTests(unittest.TestCase):
+
+    def setUp(self):
+        self.buffer = io._ReadBuffer(8)
+
+    def _write(self, data):
+        with self.buffer.writable(len(data)) as view:
+            view[:len(data)] = data
+        self.buffer.written(len(data))
+
+    def _unread(self):
+        with self.buffer.readable() as view:
+            return view.tobytes()
+
+    def test_written_data_is_readable(self):
+        self._write(b'foo')
+        self.assertEqual(self._unread(), b'foo')
+
+    def test_consume_removes_data(self):
+        self._write(b'foobar')
+        self.buffer.consume(3)
+        self.assertEqual(self._unread(), b'bar')
+
+    def test_consume_all_resets_positions(self):
+        self._write(b'foobar')
+        self.buffer.consume(6)
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(self.buffer._start, 0)
+        self.assertEqual(self.buffer._end, 0)
+
+    def test_writable_compacts_unread_data(self):
+        self._write(b'foobar')
+        self.buffer.consume(3)
+        self._write(b'bazqux')
+        self.assertEqual(self._unread(), b'barbazqux')
+        self.assertEqual(self.buffer._start, 0)
+
+    def test_writable_grows_buffer(self):
+        self._write(b'foobar')
+        self._write(b'bazqux')
+        self.assertEqual(self._unread(), b'foobarbazqux')
+
+
+class PollerSelectionTests(unittest.TestCase):
+
+    def test_epoll_preferred(self):
+        with mock.patch.dict('os.environ', clear=True):
+            with mock.patch.object(select, 'epoll', create=True):
+                self.assertIs(io._get_poller_class(), io._EPollPoller)
+
+    def test_select_fallback(self):
+        with mock.patch.dict('os.environ', clear=True):
+            with mock.patch('rabbitpy.io.select', spec=['select', 'error']):
+                self.assertIs(io._get_poller_class(), io._SelectPoller)
+
+    def test_environment_override(self):
+        with mock.patch.dict('os.environ', {'RABBITPY_POLLER': 'select'}):
+            self.assertIs(io._get_poller_class(), io._SelectPoller)
+
+    def test_unavailable_environment_override_ignored(self):
+        with mock.patch.dict('os.environ', clear=True):
+            expectation = io._get_poller_class()
+        with mock.patch.dict('os.environ', {'RABBITPY_POLLER': 'foo'}):
+            self.assertIs(io._get_poller_class(), expectation)
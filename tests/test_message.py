@@ -11,6 +11,7 @@ import uuid
 
 import mock
 from pamqp import body
+from pamqp import frame
 from pamqp import header
 from pamqp import specification
 
@@ -40,6 +41,17 @@ class TestCreation(helpers.TestCase):
     def test_message_message_id_property_set(self):
         self.assertIn('message_id', self.msg.properties)
 
+    def test_message_message_id_property_is_unique(self):
+        msg = message.Message(self.channel, self.body, opinionated=True)
+        self.assertNotEqual(msg.properties['message_id'],
+                            self.msg.properties['message_id'])
+
+    def test_message_message_id_property_uuid(self):
+        msg = message.Message(self.channel, self.body, opinionated=True,
+                              uuid_message_id=True)
+        value = msg.properties['message_id']
+        self.assertEqual(str(uuid.UUID(value)), value)
+
 
 class TestCreationWithDictBody(helpers.TestCase):
 
@@ -443,6 +455,45 @@ class TestPublishing(helpers.TestCase):
         self.assertEqual(self.write_frames.mock_calls[0][1][0][2].value,
                          bytes(json.dumps(self.BODY).encode('utf-8')))
 
+    def test_properties_reused_when_unchanged(self):
+        with mock.patch('rabbitpy.channel.Channel.write_frames') as wframes:
+            self.msg.publish(self.EXCHANGE, self.ROUTING_KEY)
+            self.assertIs(wframes.mock_calls[0][1][0][1].properties,
+                          self.write_frames.mock_calls[0][1][0][1].properties)
+
+    def test_properties_rebuilt_when_changed(self):
+        self.msg.properties['app_id'] = 'bar'
+        with mock.patch('rabbitpy.channel.Channel.write_frames') as wframes:
+            self.msg.publish(self.EXCHANGE, self.ROUTING_KEY)
+            self.assertEqual(wframes.mock_calls[0][1][0][1].properties.app_id,
+                             b'bar')
+
+
+class TestPublishingMultipleBodyFrames(helpers.TestCase):
+
+    BODY = b'0123456789' * 10000
+    EXCHANGE = 'foo'
+    ROUTING_KEY = 'bar.baz'
+
+    @mock.patch('rabbitpy.channel.Channel.write_frames')
+    def setUp(self, write_frames):
+        super(TestPublishingMultipleBodyFrames, self).setUp()
+        self.write_frames = write_frames
+        self.msg = message.Message(self.channel, self.BODY)
+        self.msg.publish(self.EXCHANGE, self.ROUTING_KEY)
+        self.body_frames = self.write_frames.mock_calls[0][1][0][2:]
+
+    def test_body_frame_count(self):
+        self.assertEqual(len(self.body_frames), 4)
+
+    def test_body_frame_sizes(self):
+        self.assertEqual([len(value.value) for value in self.body_frames],
+                         [32768, 32768, 32768, 1696])
+
+    def test_body_frames_value(self):
+        self.assertEqual(b''.join(frame.marshal(value, 1)[7:-1]
+                                  for value in self.body_frames), self.BODY)
+
 
 class TestJSONDeserialization(helpers.TestCase):
 
@@ -6,7 +6,11 @@ try:
     import unittest2 as unittest
 except ImportError:
     import unittest
+import socket
 import sys
+
+import mock
+
 from rabbitpy import utils
 
 # 3 Unicode Compatibility hack
@@ -65,3 +69,46 @@ class UtilsTestCase(unittest.TestCase):
 
     def test_unqoute(self):
         self.assertEqual(utils.unquote(self.PATH), '//')
+
+
+class TriggerWriteTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.listener, self.trigger = socket.socketpair()
+        self.trigger.setblocking(0)
+
+    def tearDown(self):
+        self.listener.close()
+        self.trigger.close()
+
+    def test_trigger_write(self):
+        utils.trigger_write(self.trigger)
+        self.assertEqual(self.listener.recv(10), b'0')
+
+    def test_trigger_write_after_close(self):
+        fileno = self.trigger.fileno()
+        self.trigger.close()
+        # The new socket pair is likely to reuse the closed descriptor
+        pair = socket.socketpair()
+        for sock in pair:
+            sock.setblocking(0)
+            self.addCleanup(sock.close)
+        if fileno not in [sock.fileno() for sock in pair]:
+            raise unittest.SkipTest('Closed descriptor was not reused')
+        utils.trigger_write(self.trigger)
+        for sock in pair:
+            self.assertRaises(socket.error, sock.recv, 10)
+
+    def test_trigger_write_with_full_buffer(self):
+        try:
+            while True:
+                self.trigger.send(b'0' * 4096)
+        except socket.error:
+            pass
+        utils.trigger_write(self.trigger)
+
+    def test_trigger_write_without_posix_uses_send(self):
+        sock = mock.Mock()
+        with mock.patch.object(utils, 'POSIX', False):
+            utils.trigger_write(sock)
+        sock.send.assert_called_once_with(b'0')